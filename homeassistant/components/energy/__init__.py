@@ -2,12 +2,12 @@
 from __future__ import annotations
 
 from homeassistant.components import frontend
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers import discovery
 from homeassistant.helpers.typing import ConfigType
 
 from . import websocket_api
-from .const import DOMAIN
+from .const import DATA_INFO_JSON, DOMAIN
 from .data import async_get_manager
 
 
@@ -32,3 +32,17 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     }
 
     return True
+
+
+@callback
+def async_set_cost_sensor(
+    hass: HomeAssistant, energy_entity_id: str, cost_entity_id: str | None
+) -> None:
+    """Register or remove (with None) the cost sensor of an energy entity."""
+    cost_sensors = hass.data[DOMAIN]["cost_sensors"]
+    if cost_entity_id is None:
+        cost_sensors.pop(energy_entity_id)
+    else:
+        cost_sensors[energy_entity_id] = cost_entity_id
+    # The serialized energy/info result includes the cost sensors
+    hass.data.pop(DATA_INFO_JSON, None)
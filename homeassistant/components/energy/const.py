@@ -1,3 +1,5 @@
 """Constants for the Energy integration."""
 
 DOMAIN = "energy"
+
+DATA_INFO_JSON = f"{DOMAIN}_info_json"
@@ -23,7 +23,7 @@ from homeassistant.helpers.event import async_track_state_change_event
 from homeassistant.helpers.typing import ConfigType, DiscoveryInfoType
 import homeassistant.util.dt as dt_util
 
-from .const import DOMAIN
+from . import async_set_cost_sensor
 from .data import EnergyManager, async_get_manager
 
 _LOGGER = logging.getLogger(__name__)
@@ -250,9 +250,9 @@ class EnergyCostSensor(SensorEntity):
         self._update_cost()
 
         # Store stat ID in hass.data so frontend can look it up
-        self.hass.data[DOMAIN]["cost_sensors"][
-            self._flow[self._adapter.entity_energy_key]
-        ] = self.entity_id
+        async_set_cost_sensor(
+            self.hass, self._flow[self._adapter.entity_energy_key], self.entity_id
+        )
 
         @callback
         def async_state_changed_listener(*_: Any) -> None:
@@ -270,8 +270,8 @@ class EnergyCostSensor(SensorEntity):
 
     async def async_will_remove_from_hass(self) -> None:
         """Handle removing from hass."""
-        self.hass.data[DOMAIN]["cost_sensors"].pop(
-            self._flow[self._adapter.entity_energy_key]
+        async_set_cost_sensor(
+            self.hass, self._flow[self._adapter.entity_energy_key], None
         )
         await super().async_will_remove_from_hass()
 
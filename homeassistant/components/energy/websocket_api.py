@@ -10,7 +10,7 @@ import voluptuous as vol
 from homeassistant.components import websocket_api
 from homeassistant.core import HomeAssistant, callback
 
-from .const import DOMAIN
+from .const import DATA_INFO_JSON, DOMAIN
 from .data import (
     DEVICE_CONSUMPTION_SCHEMA,
     ENERGY_SOURCE_SCHEMA,
@@ -38,9 +38,23 @@ def async_setup(hass: HomeAssistant) -> None:
 
 
 def _ws_with_manager(
-    func: Any,
+    func: EnergyWebSocketCommandHandler | AsyncEnergyWebSocketCommandHandler,
 ) -> websocket_api.WebSocketCommandHandler:
     """Decorate a function to pass in a manager."""
+    if asyncio.iscoroutinefunction(func):
+        async_func = cast(AsyncEnergyWebSocketCommandHandler, func)
+
+        @websocket_api.async_response
+        @functools.wraps(func)
+        async def async_with_manager(
+            hass: HomeAssistant, connection: websocket_api.ActiveConnection, msg: dict
+        ) -> None:
+            manager = await async_get_manager(hass)
+            await async_func(hass, connection, msg, manager)
+
+        return async_with_manager
+
+    sync_func = cast(EnergyWebSocketCommandHandler, func)
 
     @websocket_api.async_response
     @functools.wraps(func)
@@ -48,11 +62,7 @@ def _ws_with_manager(
         hass: HomeAssistant, connection: websocket_api.ActiveConnection, msg: dict
     ) -> None:
         manager = await async_get_manager(hass)
-
-        result = func(hass, connection, msg, manager)
-
-        if asyncio.iscoroutine(result):
-            await result
+        sync_func(hass, connection, msg, manager)
 
     return with_manager
 
@@ -94,10 +104,11 @@ async def ws_save_prefs(
     manager: EnergyManager,
 ) -> None:
     """Handle get prefs command."""
-    msg_id = msg.pop("id")
-    msg.pop("type")
-    await manager.async_update(cast(EnergyPreferencesUpdate, msg))
-    connection.send_result(msg_id, manager.data)
+    update = {
+        key: msg[key] for key in ("energy_sources", "device_consumption") if key in msg
+    }
+    await manager.async_update(cast(EnergyPreferencesUpdate, update))
+    connection.send_result(msg["id"], manager.data)
 
 
 @websocket_api.websocket_command(
@@ -111,5 +122,14 @@ def ws_info(
     connection: websocket_api.ActiveConnection,
     msg: dict,
 ) -> None:
-    """Handle get info command."""
-    connection.send_result(msg["id"], hass.data[DOMAIN])
+    """Handle get info command.
+
+    The result only changes when cost sensors are added or removed,
+    so it is serialized once and reused until invalidated.
+    """
+    info_json: str | None = hass.data.get(DATA_INFO_JSON)
+    if info_json is None:
+        info_json = hass.data[
+            DATA_INFO_JSON
+        ] = websocket_api.result_message_json_template(hass.data[DOMAIN])
+    connection.send_message(websocket_api.cached_result_message(msg["id"], info_json))
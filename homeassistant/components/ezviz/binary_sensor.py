@@ -32,7 +32,7 @@ async def async_setup_entry(
                 continue
 
             if name in BinarySensorType.__members__:
-                sensor_type_name = getattr(BinarySensorType, name).value
+                sensor_type_name = BinarySensorType[name].value
                 sensors.append(
                     EzvizBinarySensor(coordinator, idx, name, sensor_type_name)
                 )
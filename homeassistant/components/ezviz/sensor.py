@@ -6,7 +6,7 @@ import logging
 from pyezviz.constants import SensorType
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity import DeviceInfo, Entity
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
@@ -16,6 +16,10 @@ from .coordinator import EzvizDataUpdateCoordinator
 
 _LOGGER = logging.getLogger(__name__)
 
+SENSOR_TYPE_VALUES = {
+    name: member.value for name, member in SensorType.__members__.items()
+}
+
 
 async def async_setup_entry(
     hass: HomeAssistant, entry: ConfigEntry, async_add_entities: AddEntitiesCallback
@@ -24,19 +28,28 @@ async def async_setup_entry(
     coordinator: EzvizDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id][
         DATA_COORDINATOR
     ]
-    sensors = []
-
-    for idx, camera in enumerate(coordinator.data):
-        for name in camera:
+    device_infos: dict[int, DeviceInfo] = {
+        idx: {
+            "identifiers": {(DOMAIN, camera["serial"])},
+            "name": camera["name"],
+            "model": camera["device_sub_category"],
+            "manufacturer": MANUFACTURER,
+            "sw_version": camera["version"],
+        }
+        for idx, camera in enumerate(coordinator.data)
+    }
+
+    async_add_entities(
+        [
+            EzvizSensor(
+                coordinator, idx, name, SENSOR_TYPE_VALUES[name], device_infos[idx]
+            )
+            for idx, camera in enumerate(coordinator.data)
+            for name in camera
             # Only add sensor with value.
-            if camera.get(name) is None:
-                continue
-
-            if name in SensorType.__members__:
-                sensor_type_name = getattr(SensorType, name).value
-                sensors.append(EzvizSensor(coordinator, idx, name, sensor_type_name))
-
-    async_add_entities(sensors)
+            if name in SENSOR_TYPE_VALUES and camera.get(name) is not None
+        ]
+    )
 
 
 class EzvizSensor(CoordinatorEntity, Entity):
@@ -50,43 +63,27 @@ class EzvizSensor(CoordinatorEntity, Entity):
         idx: int,
         name: str,
         sensor_type_name: str,
+        device_info: DeviceInfo,
     ) -> None:
         """Initialize the sensor."""
         super().__init__(coordinator)
         self._idx = idx
-        self._camera_name = self.coordinator.data[self._idx]["name"]
         self._name = name
-        self._sensor_name = f"{self._camera_name}.{self._name}"
-        self.sensor_type_name = sensor_type_name
-        self._serial = self.coordinator.data[self._idx]["serial"]
-
-    @property
-    def name(self) -> str:
-        """Return the name of the Ezviz sensor."""
-        return self._name
+        self._camera = self.coordinator.data[self._idx]
+        self._attr_name = name
+        self._attr_unique_id = (
+            f"{self._camera['serial']}_{self._camera['name']}.{self._name}"
+        )
+        self._attr_device_class = sensor_type_name
+        self._attr_device_info = device_info
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated data from the coordinator."""
+        self._camera = self.coordinator.data[self._idx]
+        super()._handle_coordinator_update()
 
     @property
     def native_value(self) -> int | str:
         """Return the state of the sensor."""
-        return self.coordinator.data[self._idx][self._name]
-
-    @property
-    def unique_id(self) -> str:
-        """Return the unique ID of this sensor."""
-        return f"{self._serial}_{self._sensor_name}"
-
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return the device_info of the device."""
-        return {
-            "identifiers": {(DOMAIN, self._serial)},
-            "name": self.coordinator.data[self._idx]["name"],
-            "model": self.coordinator.data[self._idx]["device_sub_category"],
-            "manufacturer": MANUFACTURER,
-            "sw_version": self.coordinator.data[self._idx]["version"],
-        }
-
-    @property
-    def device_class(self) -> str:
-        """Device class for the sensor."""
-        return self.sensor_type_name
+        return self._camera[self._name]
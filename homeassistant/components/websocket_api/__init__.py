@@ -32,9 +32,11 @@ from .decorators import (  # noqa: F401
 )
 from .messages import (  # noqa: F401
     BASE_COMMAND_MESSAGE_SCHEMA,
+    cached_result_message,
     error_message,
     event_message,
     result_message,
+    result_message_json_template,
 )
 
 DOMAIN: Final = const.DOMAIN
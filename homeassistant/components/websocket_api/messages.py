@@ -32,7 +32,7 @@ IDEN_TEMPLATE: Final = "__IDEN__"
 IDEN_JSON_TEMPLATE: Final = '"__IDEN__"'
 
 
-def result_message(iden: int, result: Any = None) -> dict[str, Any]:
+def result_message(iden: JSON_TYPE, result: Any = None) -> dict[str, Any]:
     """Return a success result message."""
     return {"id": iden, "type": const.TYPE_RESULT, "success": True, "result": result}
 
@@ -74,6 +74,24 @@ def _cached_event_message(event: Event) -> str:
     return message_to_json(event_message(IDEN_TEMPLATE, event))
 
 
+def result_message_json_template(result: Any) -> str:
+    """Serialize a success result message once for use with cached_result_message.
+
+    The IDEN_TEMPLATE is used which will be replaced
+    with the actual iden in cached_result_message
+    """
+    return message_to_json(result_message(IDEN_TEMPLATE, result))
+
+
+def cached_result_message(iden: int, json_template: str) -> str:
+    """Return a success result message from a serialized template.
+
+    Lets a result that rarely changes be serialized once and
+    sent for many requests.
+    """
+    return json_template.replace(IDEN_JSON_TEMPLATE, str(iden), 1)
+
+
 def message_to_json(message: dict[str, Any]) -> str:
     """Serialize a websocket message to json."""
     try:
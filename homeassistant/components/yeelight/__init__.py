@@ -587,11 +587,7 @@ class YeelightEntity(Entity):
         if entry.unique_id is not None:
             # Use entry unique id (device id) whenever possible
             self._unique_id = entry.unique_id
-
-    @property
-    def unique_id(self) -> str:
-        """Return the unique ID."""
-        return self._unique_id
+        self._attr_unique_id = self._unique_id
 
     @property
     def device_info(self) -> DeviceInfo:
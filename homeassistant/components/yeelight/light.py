@@ -1,12 +1,20 @@
 """Light platform support for yeelight."""
 from __future__ import annotations
 
+from functools import partial
 import logging
-import math
 
 import voluptuous as vol
-import yeelight
-from yeelight import Bulb, BulbException, Flow, RGBTransition, SleepTransition, flows
+from yeelight import (
+    Bulb,
+    BulbException,
+    Flow,
+    HSVTransition,
+    RGBTransition,
+    SleepTransition,
+    TemperatureTransition,
+    flows,
+)
 from yeelight.enums import BulbType, LightType, PowerMode, SceneClass
 
 from homeassistant.components.light import (
@@ -32,12 +40,11 @@ from homeassistant.components.light import (
     LightEntity,
 )
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import ATTR_ENTITY_ID, ATTR_MODE, CONF_NAME
+from homeassistant.const import ATTR_MODE, CONF_NAME
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers import entity_platform
 import homeassistant.helpers.config_validation as cv
 from homeassistant.helpers.dispatcher import async_dispatcher_connect
-import homeassistant.util.color as color_util
 from homeassistant.util.color import (
     color_temperature_kelvin_to_mired as kelvin_to_mired,
     color_temperature_mired_to_kelvin as mired_to_kelvin,
@@ -60,6 +67,10 @@ from . import (
     DATA_UPDATED,
     DOMAIN,
     YEELIGHT_FLOW_TRANSITION_SCHEMA,
+    YEELIGHT_HSV_TRANSACTION,
+    YEELIGHT_RGB_TRANSITION,
+    YEELIGHT_SLEEP_TRANSACTION,
+    YEELIGHT_TEMPERATURE_TRANSACTION,
     YeelightEntity,
 )
 
@@ -67,6 +78,9 @@ _LOGGER = logging.getLogger(__name__)
 
 SUPPORT_YEELIGHT = SUPPORT_TRANSITION | SUPPORT_FLASH | SUPPORT_EFFECT
 
+_AMBIENT_MIN_MIREDS = kelvin_to_mired(6500)
+_AMBIENT_MAX_MIREDS = kelvin_to_mired(1700)
+
 ATTR_MINUTES = "minutes"
 
 SERVICE_SET_MODE = "set_mode"
@@ -150,6 +164,7 @@ EFFECTS_MAP = {
     EFFECT_CHRISTMAS: flows.christmas,
     EFFECT_RGB: flows.rgb,
     EFFECT_RANDOM_LOOP: flows.random_loop,
+    EFFECT_FAST_RANDOM_LOOP: partial(flows.random_loop, duration=250),
     EFFECT_LSD: flows.lsd,
     EFFECT_SLOWDOWN: flows.slowdown,
     EFFECT_HOME: flows.home,
@@ -161,6 +176,16 @@ EFFECTS_MAP = {
     EFFECT_ROMANCE: flows.romance,
     EFFECT_HAPPY_BIRTHDAY: flows.happy_birthday,
     EFFECT_CANDLE_FLICKER: flows.candle_flicker,
+    EFFECT_WHATSAPP: partial(flows.pulse, 37, 211, 102, count=2),
+    EFFECT_FACEBOOK: partial(flows.pulse, 59, 89, 152, count=2),
+    EFFECT_TWITTER: partial(flows.pulse, 0, 172, 237, count=2),
+}
+
+TRANSITIONS_MAP = {
+    YEELIGHT_RGB_TRANSITION: RGBTransition,
+    YEELIGHT_HSV_TRANSACTION: HSVTransition,
+    YEELIGHT_TEMPERATURE_TRANSACTION: TemperatureTransition,
+    YEELIGHT_SLEEP_TRANSACTION: SleepTransition,
 }
 
 VALID_BRIGHTNESS = vol.All(vol.Coerce(int), vol.Range(min=1, max=100))
@@ -211,8 +236,8 @@ def _transitions_config_parser(transitions):
     """Parse transitions config into initialized objects."""
     transition_objects = []
     for transition_config in transitions:
-        transition, params = list(transition_config.items())[0]
-        transition_objects.append(getattr(yeelight, transition)(*params))
+        ((transition, params),) = transition_config.items()
+        transition_objects.append(TRANSITIONS_MAP[transition](*params))
 
     return transition_objects
 
@@ -225,11 +250,9 @@ def _parse_custom_effects(effects_config):
         action = Flow.actions[params[ATTR_ACTION]]
         transitions = _transitions_config_parser(params[ATTR_TRANSITIONS])
 
-        effects[config[CONF_NAME]] = {
-            ATTR_COUNT: params[ATTR_COUNT],
-            ATTR_ACTION: action,
-            ATTR_TRANSITIONS: transitions,
-        }
+        effects[config[CONF_NAME]] = Flow(
+            count=params[ATTR_COUNT], action=action, transitions=transitions
+        )
 
     return effects
 
@@ -256,44 +279,27 @@ async def async_setup_entry(
     device = hass.data[DOMAIN][DATA_CONFIG_ENTRIES][config_entry.entry_id][DATA_DEVICE]
     _LOGGER.debug("Adding %s", device.name)
 
-    nl_switch_light = device.config.get(CONF_NIGHTLIGHT_SWITCH)
-
-    lights = []
-
-    device_type = device.type
-
-    def _lights_setup_helper(klass):
-        lights.append(klass(device, config_entry, custom_effects=custom_effects))
+    nl_switch_light = (
+        device.config.get(CONF_NIGHTLIGHT_SWITCH) and device.is_nightlight_supported
+    )
 
-    if device_type == BulbType.White:
-        _lights_setup_helper(YeelightGenericLight)
-    elif device_type == BulbType.Color:
-        if nl_switch_light and device.is_nightlight_supported:
-            _lights_setup_helper(YeelightColorLightWithNightlightSwitch)
-            _lights_setup_helper(YeelightNightLightModeWithoutBrightnessControl)
-        else:
-            _lights_setup_helper(YeelightColorLightWithoutNightlightSwitch)
-    elif device_type == BulbType.WhiteTemp:
-        if nl_switch_light and device.is_nightlight_supported:
-            _lights_setup_helper(YeelightWithNightLight)
-            _lights_setup_helper(YeelightNightLightMode)
-        else:
-            _lights_setup_helper(YeelightWhiteTempWithoutNightlightSwitch)
-    elif device_type == BulbType.WhiteTempMood:
-        if nl_switch_light and device.is_nightlight_supported:
-            _lights_setup_helper(YeelightNightLightModeWithAmbientSupport)
-            _lights_setup_helper(YeelightWithAmbientAndNightlight)
-        else:
-            _lights_setup_helper(YeelightWithAmbientWithoutNightlight)
-        _lights_setup_helper(YeelightAmbientLight)
+    light_classes_options = LIGHT_CLASSES_BY_BULB_TYPE.get(device.type)
+    if light_classes_options is not None:
+        with_nightlight, without_nightlight = light_classes_options
+        light_classes = with_nightlight if nl_switch_light else without_nightlight
     else:
-        _lights_setup_helper(YeelightGenericLight)
+        light_classes = (YeelightGenericLight,)
         _LOGGER.warning(
             "Cannot determine device type for %s, %s. Falling back to white only",
             device.host,
             device.name,
         )
 
+    lights = [
+        klass(device, config_entry, custom_effects=custom_effects)
+        for klass in light_classes
+    ]
+
     async_add_entities(lights, True)
     _async_setup_services(hass)
 
@@ -303,10 +309,11 @@ def _async_setup_services(hass: HomeAssistant):
     """Set up custom services."""
 
     async def _async_start_flow(entity, service_call):
-        params = {**service_call.data}
-        params.pop(ATTR_ENTITY_ID)
-        params[ATTR_TRANSITIONS] = _transitions_config_parser(params[ATTR_TRANSITIONS])
-        await entity.async_start_flow(**params)
+        await entity.async_start_flow(
+            _transitions_config_parser(service_call.data[ATTR_TRANSITIONS]),
+            service_call.data[ATTR_COUNT],
+            service_call.data[ATTR_ACTION],
+        )
 
     async def _async_set_color_scene(entity, service_call):
         await entity.async_set_scene(
@@ -383,12 +390,19 @@ class YeelightGenericLight(YeelightEntity, LightEntity):
 
     _attr_color_mode = COLOR_MODE_BRIGHTNESS
     _attr_supported_color_modes = {COLOR_MODE_BRIGHTNESS}
+    _attr_supported_features = SUPPORT_YEELIGHT
+
+    _brightness_property = "bright"
+    _power_property = "power"
+    _turn_on_power_mode = PowerMode.LAST
+    _predefined_effects = YEELIGHT_MONO_EFFECT_LIST
 
     def __init__(self, device, entry, custom_effects=None):
         """Initialize the Yeelight light."""
         super().__init__(device, entry)
 
         self.config = device.config
+        self._attr_name = device.name
 
         self._color_temp = None
         self._effect = None
@@ -404,6 +418,8 @@ class YeelightGenericLight(YeelightEntity, LightEntity):
         else:
             self._custom_effects = {}
 
+        self._attr_effect_list = self._predefined_effects + self.custom_effects_names
+
     async def async_added_to_hass(self):
         """Handle entity which will be added."""
         self.async_on_remove(
@@ -415,16 +431,6 @@ class YeelightGenericLight(YeelightEntity, LightEntity):
         )
         await super().async_added_to_hass()
 
-    @property
-    def supported_features(self) -> int:
-        """Flag supported features."""
-        return SUPPORT_YEELIGHT
-
-    @property
-    def effect_list(self):
-        """Return the list of supported effects."""
-        return self._predefined_effects + self.custom_effects_names
-
     @property
     def color_temp(self) -> int:
         """Return the color temperature."""
@@ -433,11 +439,6 @@ class YeelightGenericLight(YeelightEntity, LightEntity):
             self._color_temp = kelvin_to_mired(int(temp_in_k))
         return self._color_temp
 
-    @property
-    def name(self) -> str:
-        """Return the name of the device if any."""
-        return self.device.name
-
     @property
     def is_on(self) -> bool:
         """Return true if device is on."""
@@ -498,12 +499,7 @@ class YeelightGenericLight(YeelightEntity, LightEntity):
         if rgb is None:
             return None
 
-        rgb = int(rgb)
-        blue = rgb & 0xFF
-        green = (rgb >> 8) & 0xFF
-        red = (rgb >> 16) & 0xFF
-
-        return (red, green, blue)
+        return tuple(int(rgb).to_bytes(3, "big"))
 
     @property
     def effect(self):
@@ -518,29 +514,14 @@ class YeelightGenericLight(YeelightEntity, LightEntity):
 
     @property
     def _properties(self) -> dict:
-        if self._bulb is None:
+        bulb = self._bulb
+        if bulb is None:
             return {}
-        return self._bulb.last_properties
+        return bulb.last_properties
 
     def _get_property(self, prop, default=None):
         return self._properties.get(prop, default)
 
-    @property
-    def _brightness_property(self):
-        return "bright"
-
-    @property
-    def _power_property(self):
-        return "power"
-
-    @property
-    def _turn_on_power_mode(self):
-        return PowerMode.LAST
-
-    @property
-    def _predefined_effects(self):
-        return YEELIGHT_MONO_EFFECT_LIST
-
     @property
     def extra_state_attributes(self):
         """Return the device specific state attributes."""
@@ -577,7 +558,7 @@ class YeelightGenericLight(YeelightEntity, LightEntity):
     async def async_set_brightness(self, brightness, duration) -> None:
         """Set bulb brightness."""
         if brightness:
-            if math.floor(self.brightness) == math.floor(brightness):
+            if self.brightness == int(brightness):
                 _LOGGER.debug("brightness already set to: %s", brightness)
                 # Already set, and since we get pushed updates
                 # we avoid setting it again to ensure we do not
@@ -662,18 +643,16 @@ class YeelightGenericLight(YeelightEntity, LightEntity):
                 count = 1
                 duration = transition * 2
 
-            red, green, blue = color_util.color_hs_to_RGB(*self.hs_color)
+            # Return to the rgb value currently reported for this light
+            red, green, blue = self.rgb_color
 
-            transitions = []
-            transitions.append(
-                RGBTransition(255, 0, 0, brightness=10, duration=duration)
-            )
-            transitions.append(SleepTransition(duration=transition))
-            transitions.append(
+            transitions = [
+                RGBTransition(255, 0, 0, brightness=10, duration=duration),
+                SleepTransition(duration=transition),
                 RGBTransition(
                     red, green, blue, brightness=self.brightness, duration=duration
-                )
-            )
+                ),
+            ]
 
             flow = Flow(count=count, transitions=transitions)
             try:
@@ -691,18 +670,10 @@ class YeelightGenericLight(YeelightEntity, LightEntity):
             await self._bulb.async_stop_flow(light_type=self.light_type)
             return
 
-        if effect in self.custom_effects_names:
-            flow = Flow(**self.custom_effects[effect])
+        if effect in self.custom_effects:
+            flow = self.custom_effects[effect]
         elif effect in EFFECTS_MAP:
             flow = EFFECTS_MAP[effect]()
-        elif effect == EFFECT_FAST_RANDOM_LOOP:
-            flow = flows.random_loop(duration=250)
-        elif effect == EFFECT_WHATSAPP:
-            flow = flows.pulse(37, 211, 102, count=2)
-        elif effect == EFFECT_FACEBOOK:
-            flow = flows.pulse(59, 89, 152, count=2)
-        elif effect == EFFECT_TWITTER:
-            flow = flows.pulse(0, 172, 237, count=2)
         else:
             return
 
@@ -808,6 +779,8 @@ class YeelightColorLightSupport(YeelightGenericLight):
 
     _attr_supported_color_modes = {COLOR_MODE_COLOR_TEMP, COLOR_MODE_HS, COLOR_MODE_RGB}
 
+    _predefined_effects = YEELIGHT_COLOR_EFFECT_LIST
+
     @property
     def color_mode(self):
         """Return the color mode."""
@@ -821,10 +794,6 @@ class YeelightColorLightSupport(YeelightGenericLight):
         _LOGGER.debug("Light reported unknown color mode: %s", color_mode)
         return COLOR_MODE_UNKNOWN
 
-    @property
-    def _predefined_effects(self):
-        return YEELIGHT_COLOR_EFFECT_LIST
-
 
 class YeelightWhiteTempLightSupport:
     """Representation of a White temp Yeelight light."""
@@ -832,17 +801,13 @@ class YeelightWhiteTempLightSupport:
     _attr_color_mode = COLOR_MODE_COLOR_TEMP
     _attr_supported_color_modes = {COLOR_MODE_COLOR_TEMP}
 
-    @property
-    def _predefined_effects(self):
-        return YEELIGHT_TEMP_ONLY_EFFECT_LIST
+    _predefined_effects = YEELIGHT_TEMP_ONLY_EFFECT_LIST
 
 
 class YeelightNightLightSupport:
     """Representation of a Yeelight nightlight support."""
 
-    @property
-    def _turn_on_power_mode(self):
-        return PowerMode.NORMAL
+    _turn_on_power_mode = PowerMode.NORMAL
 
 
 class YeelightColorLightWithoutNightlightSwitch(
@@ -850,9 +815,7 @@ class YeelightColorLightWithoutNightlightSwitch(
 ):
     """Representation of a Color Yeelight light."""
 
-    @property
-    def _brightness_property(self):
-        return "current_brightness"
+    _brightness_property = "current_brightness"
 
 
 class YeelightColorLightWithNightlightSwitch(
@@ -866,7 +829,10 @@ class YeelightColorLightWithNightlightSwitch(
     @property
     def is_on(self) -> bool:
         """Return true if device is on."""
-        return super().is_on and not self.device.is_nightlight_enabled
+        return (
+            self._get_property(self._power_property) == "on"
+            and not self.device.is_nightlight_enabled
+        )
 
 
 class YeelightWhiteTempWithoutNightlightSwitch(
@@ -874,9 +840,7 @@ class YeelightWhiteTempWithoutNightlightSwitch(
 ):
     """White temp light, when nightlight switch is not set to light."""
 
-    @property
-    def _brightness_property(self):
-        return "current_brightness"
+    _brightness_property = "current_brightness"
 
 
 class YeelightWithNightLight(
@@ -890,12 +854,19 @@ class YeelightWithNightLight(
     @property
     def is_on(self) -> bool:
         """Return true if device is on."""
-        return super().is_on and not self.device.is_nightlight_enabled
+        return (
+            self._get_property(self._power_property) == "on"
+            and not self.device.is_nightlight_enabled
+        )
 
 
 class YeelightNightLightMode(YeelightGenericLight):
     """Representation of a Yeelight when in nightlight mode."""
 
+    _brightness_property = "nl_br"
+    _turn_on_power_mode = PowerMode.MOONLIGHT
+    _predefined_effects = YEELIGHT_TEMP_ONLY_EFFECT_LIST
+
     @property
     def unique_id(self) -> str:
         """Return a unique ID."""
@@ -915,27 +886,16 @@ class YeelightNightLightMode(YeelightGenericLight):
     @property
     def is_on(self) -> bool:
         """Return true if device is on."""
-        return super().is_on and self.device.is_nightlight_enabled
-
-    @property
-    def _brightness_property(self):
-        return "nl_br"
-
-    @property
-    def _turn_on_power_mode(self):
-        return PowerMode.MOONLIGHT
-
-    @property
-    def _predefined_effects(self):
-        return YEELIGHT_TEMP_ONLY_EFFECT_LIST
+        return (
+            self._get_property(self._power_property) == "on"
+            and self.device.is_nightlight_enabled
+        )
 
 
 class YeelightNightLightModeWithAmbientSupport(YeelightNightLightMode):
     """Representation of a Yeelight, with ambient support, when in nightlight mode."""
 
-    @property
-    def _power_property(self):
-        return "main_power"
+    _power_property = "main_power"
 
 
 class YeelightNightLightModeWithoutBrightnessControl(YeelightNightLightMode):
@@ -946,11 +906,7 @@ class YeelightNightLightModeWithoutBrightnessControl(YeelightNightLightMode):
 
     _attr_color_mode = COLOR_MODE_ONOFF
     _attr_supported_color_modes = {COLOR_MODE_ONOFF}
-
-    @property
-    def supported_features(self):
-        """Flag no supported features."""
-        return 0
+    _attr_supported_features = 0
 
 
 class YeelightWithAmbientWithoutNightlight(YeelightWhiteTempWithoutNightlightSwitch):
@@ -959,9 +915,7 @@ class YeelightWithAmbientWithoutNightlight(YeelightWhiteTempWithoutNightlightSwi
     And nightlight switch type is none.
     """
 
-    @property
-    def _power_property(self):
-        return "main_power"
+    _power_property = "main_power"
 
 
 class YeelightWithAmbientAndNightlight(YeelightWithNightLight):
@@ -970,9 +924,7 @@ class YeelightWithAmbientAndNightlight(YeelightWithNightLight):
     And nightlight switch type is set to light.
     """
 
-    @property
-    def _power_property(self):
-        return "main_power"
+    _power_property = "main_power"
 
 
 class YeelightAmbientLight(YeelightColorLightWithoutNightlightSwitch):
@@ -980,28 +932,17 @@ class YeelightAmbientLight(YeelightColorLightWithoutNightlightSwitch):
 
     PROPERTIES_MAPPING = {"color_mode": "bg_lmode"}
 
+    _brightness_property = "bright"
+
     def __init__(self, *args, **kwargs):
         """Initialize the Yeelight Ambient light."""
         super().__init__(*args, **kwargs)
-        self._min_mireds = kelvin_to_mired(6500)
-        self._max_mireds = kelvin_to_mired(1700)
+        self._min_mireds = _AMBIENT_MIN_MIREDS
+        self._max_mireds = _AMBIENT_MAX_MIREDS
 
         self._light_type = LightType.Ambient
-
-    @property
-    def unique_id(self) -> str:
-        """Return a unique ID."""
-        unique = super().unique_id
-        return f"{unique}-ambilight"
-
-    @property
-    def name(self) -> str:
-        """Return the name of the device if any."""
-        return f"{self.device.name} ambilight"
-
-    @property
-    def _brightness_property(self):
-        return "bright"
+        self._attr_unique_id = f"{self._unique_id}-ambilight"
+        self._attr_name = f"{self.device.name} ambilight"
 
     def _get_property(self, prop, default=None):
         bg_prop = self.PROPERTIES_MAPPING.get(prop)
@@ -1010,3 +951,29 @@ class YeelightAmbientLight(YeelightColorLightWithoutNightlightSwitch):
             bg_prop = f"bg_{prop}"
 
         return super()._get_property(bg_prop, default)
+
+
+# Light entities to create per bulb type,
+# as (with nightlight switch, without nightlight switch)
+LIGHT_CLASSES_BY_BULB_TYPE = {
+    BulbType.White: ((YeelightGenericLight,), (YeelightGenericLight,)),
+    BulbType.Color: (
+        (
+            YeelightColorLightWithNightlightSwitch,
+            YeelightNightLightModeWithoutBrightnessControl,
+        ),
+        (YeelightColorLightWithoutNightlightSwitch,),
+    ),
+    BulbType.WhiteTemp: (
+        (YeelightWithNightLight, YeelightNightLightMode),
+        (YeelightWhiteTempWithoutNightlightSwitch,),
+    ),
+    BulbType.WhiteTempMood: (
+        (
+            YeelightNightLightModeWithAmbientSupport,
+            YeelightWithAmbientAndNightlight,
+            YeelightAmbientLight,
+        ),
+        (YeelightWithAmbientWithoutNightlight, YeelightAmbientLight),
+    ),
+}
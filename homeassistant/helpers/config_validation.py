@@ -122,15 +122,15 @@ def path(value: Any) -> str:
 # https://github.com/alecthomas/voluptuous/issues/115#issuecomment-144464666
 def has_at_least_one_key(*keys: str) -> Callable:
     """Validate that at least one key exists."""
+    key_set = set(keys)
 
     def validate(obj: dict) -> dict:
         """Test keys exist in dict."""
         if not isinstance(obj, dict):
             raise vol.Invalid("expected dictionary")
 
-        for k in obj:
-            if k in keys:
-                return obj
+        if not key_set.isdisjoint(obj):
+            return obj
         raise vol.Invalid("must contain at least one of {}.".format(", ".join(keys)))
 
     return validate
@@ -138,13 +138,14 @@ def has_at_least_one_key(*keys: str) -> Callable:
 
 def has_at_most_one_key(*keys: str) -> Callable[[dict], dict]:
     """Validate that zero keys exist or one key exists."""
+    key_set = set(keys)
 
     def validate(obj: dict) -> dict:
         """Test zero keys exist or one key exists in dict."""
         if not isinstance(obj, dict):
             raise vol.Invalid("expected dictionary")
 
-        if len(set(keys) & set(obj)) > 1:
+        if len(key_set.intersection(obj)) > 1:
             raise vol.Invalid("must contain at most one of {}.".format(", ".join(keys)))
         return obj
 
@@ -157,9 +158,9 @@ def boolean(value: Any) -> bool:
         return value
     if isinstance(value, str):
         value = value.lower().strip()
-        if value in ("1", "true", "yes", "on", "enable"):
+        if value in {"1", "true", "yes", "on", "enable"}:
             return True
-        if value in ("0", "false", "no", "off", "disable"):
+        if value in {"0", "false", "no", "off", "disable"}:
             return False
     elif isinstance(value, Number):
         # type ignore: https://github.com/python/mypy/issues/3186
@@ -513,11 +514,13 @@ def string(value: Any) -> str:
     return str(value)
 
 
+_HTML_TAG = re.compile(r"<[a-z][\s\S]*>")
+
+
 def string_with_no_html(value: Any) -> str:
     """Validate that the value is a string without HTML."""
     value = string(value)
-    regex = re.compile(r"<[a-z][\s\S]*>")
-    if regex.search(value):
+    if "<" in value and _HTML_TAG.search(value):
         raise vol.Invalid("the string should not contain HTML")
     return str(value)
 
@@ -638,13 +641,15 @@ def socket_timeout(value: Any | None) -> object:
         raise vol.Invalid(f"Invalid socket timeout: {err}")
 
 
-# pylint: disable=no-value-for-parameter
+_URL_SCHEMA = vol.Schema(vol.Url())  # pylint: disable=no-value-for-parameter
+
+
 def url(value: Any) -> str:
     """Validate an URL."""
     url_in = str(value)
 
-    if urlparse(url_in).scheme in ["http", "https"]:
-        return cast(str, vol.Schema(vol.Url())(url_in))
+    if urlparse(url_in).scheme in ("http", "https"):
+        return cast(str, _URL_SCHEMA(url_in))
 
     raise vol.Invalid("invalid url")
 
@@ -659,10 +664,12 @@ def url_no_path(value: Any) -> str:
     return url_in
 
 
+_X10_ADDRESS = re.compile(r"([A-Pa-p]{1})(?:[2-9]|1[0-6]?)$")
+
+
 def x10_address(value: str) -> str:
     """Validate an x10 address."""
-    regex = re.compile(r"([A-Pa-p]{1})(?:[2-9]|1[0-6]?)$")
-    if not regex.match(value):
+    if not _X10_ADDRESS.match(value):
         raise vol.Invalid("Invalid X10 Address")
     return str(value).lower()
 
@@ -723,7 +730,9 @@ def deprecated(
         - No warning if neither key nor replacement_key are provided
             - Adds replacement_key with default value in this case
     """
-    module = inspect.getmodule(inspect.stack(context=0)[1].frame)
+    frame = inspect.currentframe()
+    module = inspect.getmodule(frame.f_back) if frame is not None else None
+    del frame
     if module is not None:
         module_name = module.__name__
     else:
@@ -743,39 +752,38 @@ def deprecated(
             " please remove it from your configuration"
         )
 
+    logger = KeywordStyleAdapter(logging.getLogger(module_name))
+    keys = [key]
+    if replacement_key:
+        keys.append(replacement_key)
+    validate_keys = has_at_most_one_key(*keys)
+
     def validator(config: dict) -> dict:
         """Check if key is in config and log warning."""
         if key in config:
-            try:
-                KeywordStyleAdapter(logging.getLogger(module_name)).warning(
-                    warning.replace(
-                        "'{key}' option",
-                        f"'{key}' option near {config.__config_file__}:{config.__line__}",  # type: ignore
-                    ),
-                    key=key,
-                    replacement_key=replacement_key,
-                )
-            except AttributeError:
-                KeywordStyleAdapter(logging.getLogger(module_name)).warning(
-                    warning,
-                    key=key,
-                    replacement_key=replacement_key,
-                )
+            if logger.isEnabledFor(logging.WARNING):
+                config_file = getattr(config, "__config_file__", None)
+                line = getattr(config, "__line__", None)
+                if config_file is not None and line is not None:
+                    message = warning.replace(
+                        "'{key}' option", f"'{key}' option near {config_file}:{line}"
+                    )
+                else:
+                    message = warning
+                logger.warning(message, key=key, replacement_key=replacement_key)
             value = config[key]
             if replacement_key:
                 config.pop(key)
         else:
             value = default
 
-        keys = [key]
         if replacement_key:
-            keys.append(replacement_key)
             if value is not None and (
                 replacement_key not in config or default == config.get(replacement_key)
             ):
                 config[replacement_key] = value
 
-        return has_at_most_one_key(*keys)(config)
+        return validate_keys(config)
 
     return validator
 
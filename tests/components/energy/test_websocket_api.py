@@ -128,6 +128,7 @@ async def test_save_preferences(hass, hass_ws_client, hass_storage) -> None:
     assert hass_storage[data.STORAGE_KEY]["data"] == new_prefs
 
     assert await is_configured(hass)
+    await hass.async_block_till_done()
 
     # Verify info reflects data.
     await client.send_json({"id": 7, "type": "energy/info"})
@@ -216,3 +217,71 @@ async def test_handle_duplicate_from_stat(hass, hass_ws_client) -> None:
     assert msg["id"] == 5
     assert not msg["success"]
     assert msg["error"]["code"] == "invalid_format"
+
+
+async def test_info_updates_with_cost_sensors(hass, hass_ws_client) -> None:
+    """Test the cached info result is refreshed when cost sensors change."""
+    client = await hass_ws_client(hass)
+
+    await client.send_json({"id": 5, "type": "energy/info"})
+
+    msg = await client.receive_json()
+
+    assert msg["id"] == 5
+    assert msg["success"]
+    assert msg["result"] == {"cost_sensors": {}}
+
+    await client.send_json(
+        {
+            "id": 6,
+            "type": "energy/save_prefs",
+            "energy_sources": [
+                {
+                    "type": "grid",
+                    "flow_from": [
+                        {
+                            "stat_energy_from": "sensor.heat_pump_meter",
+                            "stat_cost": None,
+                            "entity_energy_from": "sensor.heat_pump_meter",
+                            "entity_energy_price": None,
+                            "number_energy_price": 0.20,
+                        }
+                    ],
+                    "flow_to": [],
+                    "cost_adjustment_day": 0,
+                },
+            ],
+        }
+    )
+
+    msg = await client.receive_json()
+
+    assert msg["id"] == 6
+    assert msg["success"]
+    await hass.async_block_till_done()
+
+    await client.send_json({"id": 7, "type": "energy/info"})
+
+    msg = await client.receive_json()
+
+    assert msg["id"] == 7
+    assert msg["success"]
+    assert msg["result"] == {
+        "cost_sensors": {"sensor.heat_pump_meter": "sensor.heat_pump_meter_cost"}
+    }
+
+    await client.send_json({"id": 8, "type": "energy/save_prefs", "energy_sources": []})
+
+    msg = await client.receive_json()
+
+    assert msg["id"] == 8
+    assert msg["success"]
+    await hass.async_block_till_done()
+
+    await client.send_json({"id": 9, "type": "energy/info"})
+
+    msg = await client.receive_json()
+
+    assert msg["id"] == 9
+    assert msg["success"]
+    assert msg["result"] == {"cost_sensors": {}}
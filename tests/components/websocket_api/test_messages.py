@@ -3,7 +3,10 @@
 from homeassistant.components.websocket_api.messages import (
     _cached_event_message as lru_event_cache,
     cached_event_message,
+    cached_result_message,
     message_to_json,
+    result_message,
+    result_message_json_template,
 )
 from homeassistant.const import EVENT_STATE_CHANGED
 from homeassistant.core import callback
@@ -78,6 +81,19 @@ async def test_cached_event_message_with_different_idens(hass):
     assert cache_info.currsize == 1
 
 
+async def test_cached_result_message():
+    """Test a serialized result message can be reused for different idens."""
+    result = {"cost_sensors": {"sensor.energy": "sensor.energy_cost"}}
+    json_template = result_message_json_template(result)
+
+    assert cached_result_message(2, json_template) == message_to_json(
+        result_message(2, result)
+    )
+    assert cached_result_message(3, json_template) == message_to_json(
+        result_message(3, result)
+    )
+
+
 async def test_message_to_json(caplog):
     """Test we can serialize websocket messages."""
 
@@ -82,9 +82,9 @@ from homeassistant.components.yeelight.light import (
     YEELIGHT_MONO_EFFECT_LIST,
     YEELIGHT_TEMP_ONLY_EFFECT_LIST,
 )
-from homeassistant.const import ATTR_ENTITY_ID, CONF_HOST, CONF_NAME
+from homeassistant.const import ATTR_AREA_ID, ATTR_ENTITY_ID, CONF_HOST, CONF_NAME
 from homeassistant.core import HomeAssistant
-from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers import area_registry as ar, entity_registry as er
 from homeassistant.setup import async_setup_component
 from homeassistant.util.color import (
     color_hs_to_RGB,
@@ -429,6 +429,67 @@ async def test_services(hass: HomeAssistant, caplog):
     )
 
 
+async def test_start_flow_service_by_area(hass: HomeAssistant):
+    """Test start_flow passes the flow params when targeted by area."""
+    config_entry = MockConfigEntry(domain=DOMAIN, data=CONFIG_ENTRY_DATA)
+    config_entry.add_to_hass(hass)
+
+    mocked_bulb = _mocked_bulb()
+    with _patch_discovery(MODULE), patch(
+        f"{MODULE}.AsyncBulb", return_value=mocked_bulb
+    ):
+        assert await hass.config_entries.async_setup(config_entry.entry_id)
+        await hass.async_block_till_done()
+
+    area = ar.async_get(hass).async_create("Living room")
+    er.async_get(hass).async_update_entity(ENTITY_LIGHT, area_id=area.id)
+
+    mocked_bulb.async_start_flow = AsyncMock()
+    await hass.services.async_call(
+        DOMAIN,
+        SERVICE_START_FLOW,
+        {
+            ATTR_AREA_ID: area.id,
+            ATTR_TRANSITIONS: [{YEELIGHT_TEMPERATURE_TRANSACTION: [1900, 2000, 60]}],
+        },
+        blocking=True,
+    )
+
+    mocked_bulb.async_start_flow.assert_called_once()
+    (flow,), kwargs = mocked_bulb.async_start_flow.call_args
+    assert kwargs == {"light_type": LightType.Main}
+    assert flow.count == 0
+    assert flow.action == Action.recover
+    assert str(flow.transitions) == str([TemperatureTransition(1900, 2000, 60)])
+
+
+async def test_flash_restores_rgb(hass: HomeAssistant):
+    """Test the flash flow ends on the light's reported rgb value."""
+    config_entry = MockConfigEntry(domain=DOMAIN, data=CONFIG_ENTRY_DATA)
+    config_entry.add_to_hass(hass)
+
+    mocked_bulb = _mocked_bulb()
+    mocked_bulb.last_properties["rgb"] = str(0x1E90FF)
+    with _patch_discovery(MODULE), patch(
+        f"{MODULE}.AsyncBulb", return_value=mocked_bulb
+    ):
+        assert await hass.config_entries.async_setup(config_entry.entry_id)
+        await hass.async_block_till_done()
+
+    await hass.services.async_call(
+        "light",
+        SERVICE_TURN_ON,
+        {ATTR_ENTITY_ID: ENTITY_LIGHT, ATTR_FLASH: FLASH_LONG},
+        blocking=True,
+    )
+
+    mocked_bulb.async_start_flow.assert_called_once()
+    (flow,), _ = mocked_bulb.async_start_flow.call_args
+    restore = flow.transitions[-1]
+    assert isinstance(restore, RGBTransition)
+    assert (restore.red, restore.green, restore.blue) == (0x1E, 0x90, 0xFF)
+
+
 async def test_state_already_set_avoid_ratelimit(hass: HomeAssistant):
     """Ensure we suppress state changes that will increase the rate limit when there is no change."""
     mocked_bulb = _mocked_bulb()